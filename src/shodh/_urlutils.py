@@ -0,0 +1,98 @@
+"""Link extraction and URL resolution for the crawl hot path.
+
+This module is kept free of crawler state and fully annotated so it can be
+compiled with mypyc (see the optional build hook in pyproject.toml). It must
+behave identically whether compiled or not.
+"""
+
+import sys
+from urllib.parse import urljoin, urlparse
+
+try:
+    from selectolax.lexbor import LexborHTMLParser as HTMLParser
+except ImportError:  # selectolax built without the Lexbor backend
+    from selectolax.parser import HTMLParser  # type: ignore[assignment,attr-defined,no-redef,unused-ignore]
+
+# hrefs that never lead to another page: same-page fragments and non-HTTP schemes.
+_SKIP_PREFIXES = ("#", "mailto:", "tel:", "javascript:", "data:")
+
+_ABSOLUTE_PREFIXES = ("http://", "https://")
+
+# Characters that may follow the host in an absolute URL.
+_HOST_TERMINATORS = ("", "/", "?", "#")
+
+# Characters urljoin strips from anywhere in a URL.
+_URL_STRIPPED_CHARS = ("\t", "\n", "\r")
+
+
+def extract_links(html: str, current_url: str, base_netloc: str) -> list[str]:
+    """Extract all links to base_netloc from HTML content, without duplicates."""
+    links: dict[str, None] = {}
+    tree = HTMLParser(html)
+
+    for node in tree.tags("a"):
+        href = node.attributes.get("href")
+        if not href or href.startswith(_SKIP_PREFIXES):
+            continue
+
+        full_url = resolve(current_url, href, base_netloc)
+        if full_url is not None:
+            # Every page repeats the same navigation links; interning keeps one
+            # copy of each URL and turns set lookups into identity checks.
+            links[sys.intern(full_url)] = None
+
+    return list(links)
+
+
+def resolve(current_url: str, href: str, base_netloc: str) -> str | None:
+    """
+    Resolve an href found on current_url to an absolute URL without fragment.
+
+    Absolute, root-relative and plain relative hrefs are joined with a few
+    string operations; anything unusual (scheme-relative, query-only, empty
+    query, dot segments, other schemes, stray whitespace) goes through urljoin.
+
+    Returns:
+        The resolved URL, or None if it points to a host other than base_netloc.
+    """
+    href = href.partition("#")[0]
+
+    # urljoin drops these from anywhere in the URL, absolute hrefs included
+    # (HTML often wraps long hrefs across lines), and normalises "/p?" to "/p".
+    # Let it handle both so every spelling of a URL is queued once.
+    if href.endswith("?") or any(char in href for char in _URL_STRIPPED_CHARS):
+        return _urljoin_same_host(current_url, href, base_netloc)
+
+    if href.startswith(_ABSOLUTE_PREFIXES):
+        # Compare the host in place rather than parsing the whole URL.
+        host_start = href.index("//") + 2
+        host_end = host_start + len(base_netloc)
+        if (
+            not href.startswith(base_netloc, host_start)
+            or href[host_end : host_end + 1] not in _HOST_TERMINATORS
+        ):
+            return None
+        return href
+
+    if (
+        not href
+        or href[0] in "?."
+        or href[0] <= " "
+        or href.startswith("//")
+        or "/." in href
+        or ":" in href.partition("/")[0]
+    ):
+        return _urljoin_same_host(current_url, href, base_netloc)
+
+    # current_url is always on the base host, so only its path matters.
+    page = current_url.partition("#")[0].partition("?")[0]
+    path_start = page.find("/", page.index("//") + 2)
+    if href[0] == "/":
+        return (page if path_start == -1 else page[:path_start]) + href
+    return (page + "/" if path_start == -1 else page[: page.rindex("/") + 1]) + href
+
+
+def _urljoin_same_host(current_url: str, href: str, base_netloc: str) -> str | None:
+    """Resolve href with urljoin, returning None if it leaves base_netloc."""
+    full_url = urljoin(current_url, href).partition("#")[0]
+    return full_url if urlparse(full_url).netloc == base_netloc else None
@@ -26,6 +26,26 @@ from .exceptions import ShodhError
     help="Request timeout in seconds.",
     show_default=True,
 )
+@click.option(
+    "-c",
+    "--concurrency",
+    default=20,
+    type=click.IntRange(min=1),
+    help="Maximum number of requests in flight at once.",
+    show_default=True,
+)
+@click.option(
+    "--max-rate",
+    default=20.0,
+    type=click.FloatRange(min=0, min_open=True),
+    help="Maximum number of requests per second.",
+    show_default=True,
+)
+@click.option(
+    "--ignore-robots",
+    is_flag=True,
+    help="Crawl links disallowed by robots.txt and ignore its Crawl-delay.",
+)
 @click.option(
     "-q",
     "--quiet",
@@ -33,13 +53,28 @@ from .exceptions import ShodhError
     help="Suppress output except errors and summary.",
 )
 @click.version_option(package_name="shodh")
-def main(url: str, output: str, timeout: int, quiet: bool) -> None:
+def main(
+    url: str,
+    output: str,
+    timeout: int,
+    concurrency: int,
+    max_rate: float,
+    ignore_robots: bool,
+    quiet: bool,
+) -> None:
     """Scan a website for broken (404) links.
 
     URL is the starting page to crawl, e.g., https://example.com
     """
     try:
-        crawler = Crawler(url, timeout=timeout, quiet=quiet)
+        crawler = Crawler(
+            url,
+            timeout=timeout,
+            quiet=quiet,
+            concurrency=concurrency,
+            max_rate=max_rate,
+            respect_robots=not ignore_robots,
+        )
         report = crawler.scan()
 
         # Print summary
@@ -1,22 +1,42 @@
 """Core crawling logic for shodh."""
 
 import csv
-import itertools
 import sys
 import threading
 import time
+from collections import deque
 from collections.abc import Callable
-from urllib.parse import urljoin, urlparse
+from importlib.metadata import PackageNotFoundError, version
+from queue import SimpleQueue
+from urllib.parse import urlparse
+from urllib.robotparser import RobotFileParser
 
 import requests
 from colorama import Fore, Style, init
-from selectolax.parser import HTMLParser
+from requests.adapters import HTTPAdapter
+from urllib3.util import make_headers
+from urllib3.util.retry import Retry
 
+from ._urlutils import extract_links
 from .exceptions import InvalidURLError
 from .types import CrawlResult, ScanReport
 
 init(autoreset=True)
 
+try:
+    _USER_AGENT = f"shodh/{version('shodh')}"
+except PackageNotFoundError:  # running from a source checkout
+    _USER_AGENT = "shodh"
+
+# Status codes servers use to reject HEAD; such URLs are checked with GET instead.
+_HEAD_UNSUPPORTED = (405, 501)
+
+# Minimum number of seconds between progress line updates.
+_PROGRESS_INTERVAL = 0.5
+
+# Only this much of a page is parsed for links; larger declared bodies are skipped.
+_MAX_BODY_BYTES = 2 * 1024 * 1024
+
 
 def _validate_url(url: str) -> str:
     """Validate and normalize a URL."""
@@ -31,6 +51,61 @@ def _validate_url(url: str) -> str:
     return url
 
 
+def _is_html(response: requests.Response) -> bool:
+    """Check whether a response carries an HTML document."""
+    return response.headers.get("Content-Type", "").startswith("text/html")
+
+
+def _read_html(response: requests.Response) -> str | None:
+    """
+    Read a streamed HTML body, stopping at _MAX_BODY_BYTES.
+
+    Returns:
+        The decoded (possibly truncated) body, or None if the server
+        declared a body larger than the cap.
+    """
+    length = response.headers.get("Content-Length", "")
+    if length.isdigit() and int(length) > _MAX_BODY_BYTES:
+        return None
+
+    body = bytearray()
+    for chunk in response.iter_content(chunk_size=64 * 1024):
+        body += chunk
+        if len(body) >= _MAX_BODY_BYTES:
+            del body[_MAX_BODY_BYTES:]
+            break
+
+    try:
+        return body.decode(response.encoding or "utf-8", errors="replace")
+    except LookupError:
+        return body.decode("utf-8", errors="replace")
+
+
+class _RateLimiter:
+    """Thread-safe token bucket allowing `rate` requests per second."""
+
+    def __init__(self, rate: float, burst: float) -> None:
+        self._rate = rate
+        self._burst = burst
+        self._tokens = burst
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        """Block until a request may be sent."""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self._burst, self._tokens + (now - self._updated) * self._rate)
+            self._updated = now
+            # Take the token now, even if that overdraws the bucket, so waiting
+            # threads are served in the order they arrived.
+            self._tokens -= 1
+            delay = -self._tokens / self._rate if self._tokens < 0 else 0.0
+
+        if delay:
+            time.sleep(delay)
+
+
 class Crawler:
     """Website crawler for detecting broken links."""
 
@@ -40,6 +115,9 @@ class Crawler:
         timeout: int = 5,
         quiet: bool = False,
         on_result: Callable[[CrawlResult], None] | None = None,
+        concurrency: int = 20,
+        max_rate: float = 20.0,
+        respect_robots: bool = True,
     ):
         """
         Initialize the crawler.
@@ -49,69 +127,158 @@ class Crawler:
             timeout: Request timeout in seconds.
             quiet: Suppress output if True.
             on_result: Optional callback for each crawl result.
+            concurrency: Maximum number of requests in flight at once.
+            max_rate: Maximum number of requests per second. A robots.txt
+                Crawl-delay lowers this further when respect_robots is True.
+                The limit applies to each URL's HEAD and GET; automatic retries
+                of 502/503/504 responses and redirect hops are not counted.
+            respect_robots: Skip links disallowed by the site's robots.txt.
         """
+        if concurrency < 1:
+            raise ValueError("concurrency must be at least 1")
+        if max_rate <= 0:
+            raise ValueError("max_rate must be positive")
+
         self.base_url = _validate_url(base_url)
+        self._base_netloc = urlparse(self.base_url).netloc
         self.timeout = timeout
         self.quiet = quiet
         self.on_result = on_result
+        self.concurrency = concurrency
+        self.max_rate = max_rate
+        self.respect_robots = respect_robots
+
+        # URLs waiting to be crawled, in discovery order, and every URL ever queued.
+        self._to_visit: deque[str] = deque()
+        self._enqueued: set[str] = set()
+        self._report = ScanReport(base_url=self.base_url)
+        self._robots: RobotFileParser | None = None
+        # Built by scan() once robots.txt is known.
+        self._limiter: _RateLimiter
+        self._session = self._create_session()
+
+    def _create_session(self) -> requests.Session:
+        """Create an HTTP session that keeps connections alive across requests."""
+        session = requests.Session()
+        session.headers.update(
+            {
+                # urllib3 lists br/zstd only when a decoder for them is installed.
+                "Accept-Encoding": make_headers(accept_encoding=True)["accept-encoding"],
+                "User-Agent": _USER_AGENT,
+            }
+        )
+        adapter = HTTPAdapter(
+            pool_connections=1,
+            pool_maxsize=self.concurrency,
+            max_retries=Retry(
+                total=2,
+                backoff_factor=0.2,
+                status_forcelist=(502, 503, 504),
+                raise_on_status=False,
+            ),
+        )
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        return session
 
-        self._visited: set[str] = set()
-        self._to_visit: set[str] = set()
-        self._results: list[CrawlResult] = []
-        self._stop_spinner = False
-        self._spinner_thread: threading.Thread | None = None
+    def close(self) -> None:
+        """Close pooled connections held by the crawler."""
+        self._session.close()
 
     def _print(self, message: str) -> None:
         """Print a message if not in quiet mode."""
         if not self.quiet:
             print(message)
 
-    def _start_spinner(self) -> None:
-        """Start the spinner animation."""
-        if self.quiet:
-            return
+    def _load_robots(self) -> RobotFileParser | None:
+        """
+        Fetch and parse the site's robots.txt.
 
-        def spinner() -> None:
-            for c in itertools.cycle(["|", "/", "-", "\\"]):
-                if self._stop_spinner:
-                    break
-                sys.stdout.write(Fore.CYAN + f"\rScanning... {c} ")
-                sys.stdout.flush()
-                time.sleep(0.1)
-            sys.stdout.write("\rScan complete!      \n")
+        Follows RobotFileParser.read(): 401/403 disallow everything, other
+        4xx allow everything. Returns None if robots.txt cannot be fetched.
+        """
+        parsed = urlparse(self.base_url)
+        robots_url = f"{parsed.scheme}://{parsed.netloc}/robots.txt"
+        robots = RobotFileParser(robots_url)
+        try:
+            response = self._session.get(robots_url, timeout=self.timeout)
+        except requests.RequestException:
+            return None
+
+        if response.status_code in (401, 403):
+            robots.parse(["User-agent: *", "Disallow: /"])
+        elif 400 <= response.status_code < 500:
+            robots.parse([])
+        elif response.status_code == 200:
+            robots.parse(response.text.splitlines())
+        else:
+            return None
+        return robots
+
+    def _create_limiter(self) -> _RateLimiter:
+        """
+        Build the request limiter from max_rate and any robots.txt Crawl-delay.
 
-        self._spinner_thread = threading.Thread(target=spinner)
-        self._spinner_thread.start()
+        A Crawl-delay caps the rate at one request per delay, with no bursts.
+        """
+        crawl_delay = self._robots.crawl_delay(_USER_AGENT) if self._robots else None
+        if crawl_delay:
+            return _RateLimiter(min(self.max_rate, 1 / float(crawl_delay)), burst=1.0)
+        return _RateLimiter(self.max_rate, burst=max(1.0, self.max_rate))
 
-    def _stop_spinner_thread(self) -> None:
-        """Stop the spinner animation."""
-        self._stop_spinner = True
-        if self._spinner_thread:
-            self._spinner_thread.join()
+    def _allowed(self, url: str) -> bool:
+        """Check whether robots.txt lets shodh crawl the URL."""
+        return self._robots is None or self._robots.can_fetch(_USER_AGENT, url)
 
-    def _extract_links(self, html: str, current_url: str) -> set[str]:
-        """Extract all same-domain links from HTML content."""
-        links: set[str] = set()
-        tree = HTMLParser(html)
-        base_netloc = urlparse(self.base_url).netloc
+    def _print_progress(self) -> None:
+        """Overwrite the progress line with the number of pages scanned so far."""
+        if not self.quiet:
+            sys.stdout.write(Fore.CYAN + f"\rScanned {self._report.total_scanned} pages... ")
+            sys.stdout.flush()
 
-        for node in tree.css("a"):
-            href = node.attributes.get("href")
-            if not href:
-                continue
+    def _start_worker(
+        self,
+        urls: SimpleQueue[str | None],
+        done: SimpleQueue[tuple[CrawlResult, list[str]]],
+    ) -> threading.Thread:
+        """Start a worker thread that crawls URLs from `urls` until it receives None."""
+
+        def work() -> None:
+            while (url := urls.get()) is not None:
+                done.put(self._crawl_url(url))
 
-            full_url = urljoin(current_url, href).split("#")[0]
-            parsed = urlparse(full_url)
+        thread = threading.Thread(target=work, name="shodh-worker", daemon=True)
+        thread.start()
+        return thread
 
-            if parsed.netloc == base_netloc:
-                links.add(full_url)
+    def _crawl_url(self, url: str) -> tuple[CrawlResult, list[str]]:
+        """
+        Crawl a single URL.
 
-        return links
+        Runs on a worker thread, so it must not touch the crawl state;
+        discovered links are handed back to the scheduler instead.
 
-    def _crawl_url(self, url: str) -> CrawlResult:
-        """Crawl a single URL and return the result."""
+        Returns:
+            The crawl result and the same-domain links found on the page.
+        """
+        links: list[str] = []
         try:
-            response = requests.get(url, timeout=self.timeout)
+            # Probe with HEAD: the status is all a broken-link check needs, and
+            # only HTML pages are worth downloading to look for more links.
+            self._limiter.acquire()
+            response = self._session.head(url, timeout=self.timeout, allow_redirects=True)
+            if response.status_code in _HEAD_UNSUPPORTED or (
+                response.status_code == 200 and _is_html(response)
+            ):
+                self._limiter.acquire()
+                # Closing a stream that was not read to the end drops the
+                # connection rather than downloading the rest of the body.
+                with self._session.get(url, timeout=self.timeout, stream=True) as response:
+                    if response.status_code == 200 and _is_html(response):
+                        html = _read_html(response)
+                        if html is not None:
+                            links = extract_links(html, url, self._base_netloc)
+
             result = CrawlResult(url=url, status_code=response.status_code)
 
             if response.status_code == 404:
@@ -119,15 +286,11 @@ class Crawler:
             else:
                 self._print(Fore.GREEN + f"\n[OK {response.status_code}] {url}")
 
-                if "text/html" in response.headers.get("Content-Type", ""):
-                    new_links = self._extract_links(response.text, url)
-                    self._to_visit.update(new_links - self._visited)
-
-            return result
+            return result, links
 
         except Exception as e:
             self._print(Fore.YELLOW + f"\n[ERROR] {url} -> {e}")
-            return CrawlResult(url=url, status_code=0, error=str(e))
+            return CrawlResult(url=url, status_code=0, error=str(e)), links
 
     def scan(self) -> ScanReport:
         """
@@ -136,10 +299,9 @@ class Crawler:
         Returns:
             ScanReport containing all crawl results.
         """
-        self._visited.clear()
-        self._to_visit = {self.base_url}
-        self._results.clear()
-        self._stop_spinner = False
+        self._to_visit = deque([self.base_url])
+        self._enqueued = {self.base_url}
+        self._report = ScanReport(base_url=self.base_url)
 
         self._print(
             Fore.GREEN
@@ -152,26 +314,57 @@ class Crawler:
             + Style.RESET_ALL
         )
 
-        self._start_spinner()
+        self._robots = self._load_robots() if self.respect_robots else None
+        self._limiter = self._create_limiter()
 
-        try:
-            while self._to_visit:
-                url = self._to_visit.pop()
+        # Workers take URLs from `urls` and hand back (result, links) on `done`;
+        # a None on `urls` tells a worker to exit.
+        urls: SimpleQueue[str | None] = SimpleQueue()
+        done: SimpleQueue[tuple[CrawlResult, list[str]]] = SimpleQueue()
+        workers: list[threading.Thread] = []
+        in_flight = 0
+        last_progress = time.monotonic()
 
-                if url in self._visited:
-                    continue
+        try:
+            while self._to_visit or in_flight:
+                # Keep the workers busy; only this thread touches the crawl state.
+                while self._to_visit and in_flight < self.concurrency:
+                    urls.put(self._to_visit.popleft())
+                    in_flight += 1
+                    if len(workers) < in_flight:
+                        workers.append(self._start_worker(urls, done))
+
+                if not in_flight:
+                    break
 
-                self._visited.add(url)
-                result = self._crawl_url(url)
-                self._results.append(result)
+                result, links = done.get()
+                in_flight -= 1
+                self._report.add_result(result)
+                for link in links:
+                    if link not in self._enqueued:
+                        # Disallowed links are remembered too, so robots.txt is
+                        # consulted once per URL.
+                        self._enqueued.add(link)
+                        if self._allowed(link):
+                            self._to_visit.append(link)
 
                 if self.on_result:
                     self.on_result(result)
 
+                now = time.monotonic()
+                if now - last_progress >= _PROGRESS_INTERVAL:
+                    self._print_progress()
+                    last_progress = now
+
         finally:
-            self._stop_spinner_thread()
+            # Workers are daemon threads, so an interrupted scan does not wait
+            # on requests whose results will be thrown away.
+            for _ in workers:
+                urls.put(None)
+            self.close()
+            self._print("\rScan complete!".ljust(40))
 
-        return ScanReport(base_url=self.base_url, results=self._results)
+        return self._report
 
 
 def scan(
@@ -179,6 +372,9 @@ def scan(
     timeout: int = 5,
     quiet: bool = False,
     on_result: Callable[[CrawlResult], None] | None = None,
+    concurrency: int = 20,
+    max_rate: float = 20.0,
+    respect_robots: bool = True,
 ) -> ScanReport:
     """
     Scan a website for broken links.
@@ -190,6 +386,10 @@ def scan(
         timeout: Request timeout in seconds.
         quiet: Suppress output if True.
         on_result: Optional callback for each crawl result.
+        concurrency: Maximum number of requests in flight at once.
+        max_rate: Maximum number of requests per second, not counting
+            retries of 502/503/504 responses or redirect hops.
+        respect_robots: Skip links disallowed by the site's robots.txt.
 
     Returns:
         ScanReport containing all crawl results.
@@ -198,7 +398,15 @@ def scan(
         >>> report = shodh.scan("https://example.com")
         >>> print(f"Found {len(report.broken_links)} broken links")
     """
-    crawler = Crawler(url, timeout=timeout, quiet=quiet, on_result=on_result)
+    crawler = Crawler(
+        url,
+        timeout=timeout,
+        quiet=quiet,
+        on_result=on_result,
+        concurrency=concurrency,
+        max_rate=max_rate,
+        respect_robots=respect_robots,
+    )
     return crawler.scan()
 
 
@@ -210,9 +418,7 @@ def export_csv(report: ScanReport, filename: str) -> None:
         report: The scan report to export.
         filename: Output filename.
     """
-    with open(filename, mode="w", newline="", encoding="utf-8") as file:
+    with open(filename, mode="w", newline="", encoding="utf-8", buffering=1 << 20) as file:
         writer = csv.writer(file)
         writer.writerow(["Broken URL"])
-
-        for result in report.broken_links:
-            writer.writerow([result.url])
+        writer.writerows([url] for url in report.broken_urls)
@@ -1,9 +1,12 @@
 """Data types for shodh scan results."""
 
-from dataclasses import dataclass, field
+from array import array
+from collections.abc import Iterable
+from dataclasses import dataclass
+from functools import cached_property
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class CrawlResult:
     """Result of crawling a single URL."""
 
@@ -22,29 +25,88 @@ class CrawlResult:
         return self.error is not None
 
 
-@dataclass
+@dataclass(init=False)
 class ScanReport:
-    """Complete report from a site scan."""
+    """
+    Complete report from a site scan.
+
+    Results are stored column-wise (urls, status_codes, error_messages) so
+    that filtering touches flat arrays instead of one object per URL. The
+    broken/errors/successful views are computed once and cached; add results
+    with add_result().
+    """
 
     base_url: str
-    results: list[CrawlResult] = field(default_factory=list)
+    urls: list[str]
+    status_codes: "array[int]"
+    error_messages: list[str | None]
+
+    def __init__(self, base_url: str, results: Iterable[CrawlResult] = ()) -> None:
+        self.base_url = base_url
+        self.urls = []
+        self.status_codes = array("i")
+        self.error_messages = []
+        for result in results:
+            self.add_result(result)
+
+    @property
+    def results(self) -> list[CrawlResult]:
+        """All crawl results, in the order they were added."""
+        return [self._result(i) for i in range(len(self.urls))]
 
     @property
     def total_scanned(self) -> int:
         """Total number of URLs scanned."""
-        return len(self.results)
+        return len(self.urls)
+
+    def add_result(self, result: CrawlResult) -> None:
+        """Append a result to the report."""
+        self.urls.append(result.url)
+        self.status_codes.append(result.status_code)
+        self.error_messages.append(result.error)
+        self.__dict__.pop("_partition", None)
+
+    def _result(self, index: int) -> CrawlResult:
+        """Rebuild the result stored at index."""
+        return CrawlResult(
+            url=self.urls[index],
+            status_code=self.status_codes[index],
+            error=self.error_messages[index],
+        )
+
+    @cached_property
+    def _partition(self) -> tuple[list[int], list[int], list[int]]:
+        """Indices of broken, errored and successful results, found in a single pass."""
+        broken: list[int] = []
+        errors: list[int] = []
+        successful: list[int] = []
+        for i, (status_code, error) in enumerate(
+            zip(self.status_codes, self.error_messages, strict=True)
+        ):
+            if status_code == 404:
+                broken.append(i)
+            if error is not None:
+                errors.append(i)
+            if status_code != 404 and error is None:
+                successful.append(i)
+        return broken, errors, successful
+
+    @property
+    def broken_urls(self) -> list[str]:
+        """URLs that returned 404."""
+        return [self.urls[i] for i in self._partition[0]]
 
     @property
     def broken_links(self) -> list[CrawlResult]:
         """List of URLs that returned 404."""
-        return [r for r in self.results if r.is_broken]
+        return [self._result(i) for i in self._partition[0]]
 
     @property
     def errors(self) -> list[CrawlResult]:
         """List of URLs that resulted in errors."""
-        return [r for r in self.results if r.is_error]
+        return [self._result(i) for i in self._partition[1]]
 
     @property
     def successful(self) -> list[CrawlResult]:
         """List of successfully crawled URLs."""
-        return [r for r in self.results if not r.is_broken and not r.is_error]
+        return [self._result(i) for i in self._partition[2]]
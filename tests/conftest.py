@@ -11,6 +11,19 @@ def mock_responses():
         yield rsps
 
 
+@pytest.fixture
+def add_page():
+    """Register a mocked page for both the HEAD probe and the follow-up GET."""
+
+    def add(url, body="", status=200, content_type="text/plain"):
+        # HEAD responses carry no body, but connection errors still apply.
+        head_body = body if isinstance(body, Exception) else ""
+        responses.add(responses.HEAD, url, body=head_body, status=status, content_type=content_type)
+        responses.add(responses.GET, url, body=body, status=status, content_type=content_type)
+
+    return add
+
+
 @pytest.fixture
 def simple_html_page():
     """Simple HTML page with links."""
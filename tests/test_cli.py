@@ -32,10 +32,9 @@ class TestCLI:
         assert "version" in result.output.lower()
 
     @responses.activate
-    def test_basic_scan(self, runner):
+    def test_basic_scan(self, runner, add_page):
         """Basic scan works with URL argument."""
-        responses.add(
-            responses.GET,
+        add_page(
             "https://example.com",
             body="<html></html>",
             status=200,
@@ -50,10 +49,9 @@ class TestCLI:
             assert os.path.exists(output_file)
 
     @responses.activate
-    def test_quiet_mode(self, runner):
+    def test_quiet_mode(self, runner, add_page):
         """Quiet mode suppresses banner output."""
-        responses.add(
-            responses.GET,
+        add_page(
             "https://example.com",
             body="<html></html>",
             status=200,
@@ -68,10 +66,9 @@ class TestCLI:
             assert "Total Pages Scanned" in result.output
 
     @responses.activate
-    def test_detects_broken_links(self, runner):
+    def test_detects_broken_links(self, runner, add_page):
         """CLI reports broken links found."""
-        responses.add(
-            responses.GET,
+        add_page(
             "https://example.com",
             body="Not Found",
             status=404,
@@ -91,10 +88,9 @@ class TestCLI:
         assert "Error" in result.output
 
     @responses.activate
-    def test_custom_timeout(self, runner):
+    def test_custom_timeout(self, runner, add_page):
         """Custom timeout is accepted."""
-        responses.add(
-            responses.GET,
+        add_page(
             "https://example.com",
             body="<html></html>",
             status=200,
@@ -111,17 +107,15 @@ class TestCLI:
             assert result.exit_code == 0
 
     @responses.activate
-    def test_csv_output_contains_broken_links(self, runner):
+    def test_csv_output_contains_broken_links(self, runner, add_page):
         """CSV output contains broken links."""
-        responses.add(
-            responses.GET,
+        add_page(
             "https://example.com",
             body='<html><a href="/broken">link</a></html>',
             status=200,
             content_type="text/html",
         )
-        responses.add(
-            responses.GET,
+        add_page(
             "https://example.com/broken",
             body="Not Found",
             status=404,
@@ -137,3 +131,54 @@ class TestCLI:
                 content = f.read()
                 assert "Broken URL" in content
                 assert "https://example.com/broken" in content
+
+    @responses.activate
+    def test_custom_concurrency(self, runner, add_page):
+        """Custom concurrency is accepted."""
+        add_page(
+            "https://example.com",
+            body="<html></html>",
+            status=200,
+            content_type="text/html",
+        )
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            output_file = os.path.join(tmpdir, "report.csv")
+            result = runner.invoke(
+                main,
+                ["https://example.com", "-o", output_file, "-q", "--concurrency", "4"],
+            )
+
+            assert result.exit_code == 0
+
+    def test_invalid_concurrency(self, runner):
+        """Concurrency below one is rejected."""
+        result = runner.invoke(main, ["https://example.com", "--concurrency", "0"])
+        assert result.exit_code == 2
+
+    @responses.activate
+    def test_rate_and_robots_options(self, runner, add_page):
+        """--max-rate and --ignore-robots are accepted."""
+        add_page(
+            "https://example.com",
+            body="<html></html>",
+            status=200,
+            content_type="text/html",
+        )
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            output_file = os.path.join(tmpdir, "report.csv")
+            result = runner.invoke(
+                main,
+                [
+                    "https://example.com",
+                    "-o",
+                    output_file,
+                    "-q",
+                    "--max-rate",
+                    "2.5",
+                    "--ignore-robots",
+                ],
+            )
+
+            assert result.exit_code == 0
@@ -1,9 +1,13 @@
 """Tests for the crawler module."""
 
+import dataclasses
+import time
+
 import pytest
 import responses
 
 from shodh import Crawler, InvalidURLError, scan
+from shodh.crawler import _RateLimiter
 from shodh.types import CrawlResult, ScanReport
 
 
@@ -30,11 +34,20 @@ class TestCrawler:
         with pytest.raises(InvalidURLError, match="Missing domain"):
             Crawler("https://", quiet=True)
 
+    def test_invalid_concurrency(self):
+        """Concurrency below one is rejected."""
+        with pytest.raises(ValueError, match="concurrency"):
+            Crawler("https://example.com", quiet=True, concurrency=0)
+
+    def test_invalid_max_rate(self):
+        """A non-positive request rate is rejected."""
+        with pytest.raises(ValueError, match="max_rate"):
+            Crawler("https://example.com", quiet=True, max_rate=0)
+
     @responses.activate
-    def test_scan_single_page(self, simple_html_page):
+    def test_scan_single_page(self, simple_html_page, add_page):
         """Scanning a single page with no links works."""
-        responses.add(
-            responses.GET,
+        add_page(
             "https://example.com",
             body="<html></html>",
             status=200,
@@ -48,10 +61,9 @@ class TestCrawler:
         assert report.results[0].status_code == 200
 
     @responses.activate
-    def test_scan_detects_404(self):
+    def test_scan_detects_404(self, add_page):
         """404 pages are detected as broken links."""
-        responses.add(
-            responses.GET,
+        add_page(
             "https://example.com",
             body="Not Found",
             status=404,
@@ -64,24 +76,21 @@ class TestCrawler:
         assert report.broken_links[0].is_broken
 
     @responses.activate
-    def test_scan_follows_internal_links(self, simple_html_page):
+    def test_scan_follows_internal_links(self, simple_html_page, add_page):
         """Crawler follows internal links."""
-        responses.add(
-            responses.GET,
+        add_page(
             "https://example.com",
             body=simple_html_page,
             status=200,
             content_type="text/html",
         )
-        responses.add(
-            responses.GET,
+        add_page(
             "https://example.com/page1",
             body="<html></html>",
             status=200,
             content_type="text/html",
         )
-        responses.add(
-            responses.GET,
+        add_page(
             "https://example.com/page2",
             body="<html></html>",
             status=200,
@@ -97,24 +106,73 @@ class TestCrawler:
         assert "https://example.com/page2" in visited_urls
 
     @responses.activate
-    def test_scan_ignores_external_links(self, simple_html_page):
+    def test_scan_follows_links_serially(self, simple_html_page, add_page):
+        """A concurrency of one still crawls the whole site."""
+        add_page(
+            "https://example.com",
+            body=simple_html_page,
+            status=200,
+            content_type="text/html",
+        )
+        add_page(
+            "https://example.com/page1",
+            body='<html><a href="/page2">Page 2</a></html>',
+            status=200,
+            content_type="text/html",
+        )
+        add_page(
+            "https://example.com/page2",
+            body="<html></html>",
+            status=404,
+        )
+
+        report = scan("https://example.com", quiet=True, concurrency=1)
+
+        assert report.total_scanned == 3
+        assert [r.url for r in report.broken_links] == ["https://example.com/page2"]
+
+    @responses.activate
+    def test_scan_visits_in_discovery_order(self, add_page):
+        """Pages are crawled breadth-first, in the order links were found."""
+        add_page(
+            "https://example.com",
+            body='<a href="/a">A</a><a href="/b">B</a><a href="/c">C</a>',
+            content_type="text/html",
+        )
+        add_page(
+            "https://example.com/a",
+            body='<a href="/d">D</a><a href="/b">B</a>',
+            content_type="text/html",
+        )
+        for path in ("/b", "/c", "/d"):
+            add_page(f"https://example.com{path}")
+
+        report = scan("https://example.com", quiet=True, concurrency=1)
+
+        assert [r.url for r in report.results] == [
+            "https://example.com",
+            "https://example.com/a",
+            "https://example.com/b",
+            "https://example.com/c",
+            "https://example.com/d",
+        ]
+
+    @responses.activate
+    def test_scan_ignores_external_links(self, simple_html_page, add_page):
         """External links are not followed."""
-        responses.add(
-            responses.GET,
+        add_page(
             "https://example.com",
             body=simple_html_page,
             status=200,
             content_type="text/html",
         )
-        responses.add(
-            responses.GET,
+        add_page(
             "https://example.com/page1",
             body="<html></html>",
             status=200,
             content_type="text/html",
         )
-        responses.add(
-            responses.GET,
+        add_page(
             "https://example.com/page2",
             body="<html></html>",
             status=200,
@@ -127,17 +185,97 @@ class TestCrawler:
         assert "https://external.com" not in visited_urls
 
     @responses.activate
-    def test_scan_strips_fragments(self, html_with_fragment):
-        """URL fragments are stripped from links."""
+    def test_scan_ignores_non_page_links(self, add_page):
+        """Non-HTTP schemes and look-alike hosts are not followed."""
+        add_page(
+            "https://example.com",
+            body="""
+            <a href="mailto:team@example.com">Mail</a>
+            <a href="tel:+100000000">Call</a>
+            <a href="javascript:void(0)">Menu</a>
+            <a href="data:text/html,hello">Data</a>
+            <a href="https://example.com.evil.test/page">Look-alike</a>
+            <a href="https://example.com:8443/page">Other port</a>
+            <a href="https://example.com?page=2">Query</a>
+            """,
+            status=200,
+            content_type="text/html",
+        )
+        add_page("https://example.com?page=2", body="<html></html>", status=200)
+
+        report = scan("https://example.com", quiet=True)
+
+        visited_urls = {r.url for r in report.results}
+        assert visited_urls == {"https://example.com", "https://example.com?page=2"}
+
+    @responses.activate
+    def test_scan_respects_robots_txt(self, add_page):
+        """Links disallowed by robots.txt are not crawled."""
         responses.add(
             responses.GET,
+            "https://example.com/robots.txt",
+            body="User-agent: *\nDisallow: /private\n",
+        )
+        add_page(
             "https://example.com",
-            body=html_with_fragment,
-            status=200,
+            body='<a href="/private/page">Private</a><a href="/public">Public</a>',
             content_type="text/html",
         )
+        add_page("https://example.com/public")
+
+        report = scan("https://example.com", quiet=True)
+
+        visited_urls = {r.url for r in report.results}
+        assert visited_urls == {"https://example.com", "https://example.com/public"}
+
+    @responses.activate
+    def test_scan_can_ignore_robots_txt(self, add_page):
+        """respect_robots=False neither fetches nor applies robots.txt."""
+        add_page(
+            "https://example.com",
+            body='<a href="/private">Private</a>',
+            content_type="text/html",
+        )
+        add_page("https://example.com/private")
+
+        report = scan("https://example.com", quiet=True, respect_robots=False)
+
+        assert report.total_scanned == 2
+        assert not any(c.request.url.endswith("/robots.txt") for c in responses.calls)
+
+    @responses.activate
+    def test_scan_honours_crawl_delay(self, add_page):
+        """A robots.txt Crawl-delay lowers the request rate."""
         responses.add(
             responses.GET,
+            "https://example.com/robots.txt",
+            body="User-agent: *\nCrawl-delay: 2\n",
+        )
+        add_page("https://example.com", status=404)
+
+        crawler = Crawler("https://example.com", quiet=True)
+        crawler.scan()
+
+        assert crawler._limiter._rate == 0.5
+
+    def test_rate_limiter_spaces_requests(self):
+        """Requests beyond the burst wait for the bucket to refill."""
+        limiter = _RateLimiter(rate=50, burst=1)
+        start = time.monotonic()
+        for _ in range(3):
+            limiter.acquire()
+        assert time.monotonic() - start >= 0.035
+
+    @responses.activate
+    def test_scan_strips_fragments(self, html_with_fragment, add_page):
+        """URL fragments are stripped from links."""
+        add_page(
+            "https://example.com",
+            body=html_with_fragment,
+            status=200,
+            content_type="text/html",
+        )
+        add_page(
             "https://example.com/page",
             body="<html></html>",
             status=200,
@@ -152,10 +290,9 @@ class TestCrawler:
         assert not any("#" in url for url in visited_urls)
 
     @responses.activate
-    def test_scan_handles_errors(self):
+    def test_scan_handles_errors(self, add_page):
         """Connection errors are captured in results."""
-        responses.add(
-            responses.GET,
+        add_page(
             "https://example.com",
             body=Exception("Connection failed"),
         )
@@ -167,10 +304,84 @@ class TestCrawler:
         assert "Connection failed" in report.results[0].error
 
     @responses.activate
-    def test_on_result_callback(self):
-        """Callback is called for each result."""
+    def test_scan_retries_gateway_errors(self, add_page):
+        """Transient 5xx gateway errors are retried."""
+        add_page("https://example.com", status=503)
+        add_page(
+            "https://example.com",
+            body="<html></html>",
+            status=200,
+            content_type="text/html",
+        )
+
+        report = scan("https://example.com", quiet=True)
+
+        assert report.results[0].status_code == 200
+
+    @responses.activate
+    def test_scan_skips_body_of_non_html(self):
+        """Non-HTML resources are checked with HEAD only."""
+        responses.add(
+            responses.HEAD,
+            "https://example.com",
+            status=200,
+            content_type="application/pdf",
+        )
+
+        report = scan("https://example.com", quiet=True)
+
+        assert report.results[0].status_code == 200
+        page_calls = [c for c in responses.calls if not c.request.url.endswith("/robots.txt")]
+        assert [call.request.method for call in page_calls] == ["HEAD"]
+
+    @responses.activate
+    def test_scan_falls_back_to_get_when_head_rejected(self, simple_html_page):
+        """Servers that reject HEAD are checked with GET."""
+        responses.add(responses.HEAD, "https://example.com", status=405)
         responses.add(
             responses.GET,
+            "https://example.com",
+            body='<html><a href="/missing">Missing</a></html>',
+            status=200,
+            content_type="text/html",
+        )
+        responses.add(responses.HEAD, "https://example.com/missing", status=404)
+
+        report = scan("https://example.com", quiet=True)
+
+        assert report.results[0].status_code == 200
+        assert [r.url for r in report.broken_links] == ["https://example.com/missing"]
+
+    @responses.activate
+    def test_scan_caps_page_size(self, add_page, monkeypatch):
+        """Only the first _MAX_BODY_BYTES of a page are parsed for links."""
+        monkeypatch.setattr("shodh.crawler._MAX_BODY_BYTES", 64)
+        add_page(
+            "https://example.com",
+            body="<html>" + " " * 100 + '<a href="/far">Far</a></html>',
+            status=200,
+            content_type="text/html",
+        )
+
+        report = scan("https://example.com", quiet=True)
+
+        assert [r.url for r in report.results] == ["https://example.com"]
+
+    @responses.activate
+    def test_scan_sends_client_headers(self, add_page):
+        """Requests identify shodh and accept compressed bodies."""
+        add_page("https://example.com", status=404)
+
+        scan("https://example.com", quiet=True)
+
+        headers = responses.calls[0].request.headers
+        assert headers["User-Agent"].startswith("shodh")
+        assert "gzip" in headers["Accept-Encoding"]
+
+    @responses.activate
+    def test_on_result_callback(self, add_page):
+        """Callback is called for each result."""
+        add_page(
             "https://example.com",
             body="<html></html>",
             status=200,
@@ -183,6 +394,22 @@ class TestCrawler:
         assert len(results) == 1
         assert isinstance(results[0], CrawlResult)
 
+    @responses.activate
+    def test_on_result_exception_stops_scan(self, simple_html_page, add_page):
+        """An exception raised by the callback aborts the scan."""
+        add_page(
+            "https://example.com",
+            body=simple_html_page,
+            status=200,
+            content_type="text/html",
+        )
+
+        def on_result(result):
+            raise RuntimeError("stop")
+
+        with pytest.raises(RuntimeError, match="stop"):
+            scan("https://example.com", quiet=True, on_result=on_result)
+
 
 class TestCrawlResult:
     """Tests for CrawlResult dataclass."""
@@ -207,6 +434,12 @@ class TestCrawlResult:
         result = CrawlResult(url="https://example.com", status_code=200)
         assert not result.is_error
 
+    def test_is_immutable(self):
+        """Results cannot be modified after creation."""
+        result = CrawlResult(url="https://example.com", status_code=200)
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            result.status_code = 404
+
 
 class TestScanReport:
     """Tests for ScanReport dataclass."""
@@ -245,3 +478,28 @@ class TestScanReport:
             ],
         )
         assert len(report.successful) == 1
+
+    def test_add_result_updates_views(self):
+        """add_result refreshes the cached views."""
+        report = ScanReport(
+            base_url="https://example.com",
+            results=[CrawlResult(url="https://example.com", status_code=200)],
+        )
+        assert len(report.broken_links) == 0
+
+        report.add_result(CrawlResult(url="https://example.com/broken", status_code=404))
+
+        assert report.total_scanned == 2
+        assert len(report.broken_links) == 1
+        assert len(report.successful) == 1
+
+    def test_results_round_trip(self):
+        """results rebuilds the added CrawlResults in order."""
+        results = [
+            CrawlResult(url="https://example.com", status_code=200),
+            CrawlResult(url="https://example.com/error", status_code=0, error="Timeout"),
+        ]
+        report = ScanReport(base_url="https://example.com", results=results)
+
+        assert report.results == results
+        assert list(report.status_codes) == [200, 0]
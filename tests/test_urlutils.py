@@ -0,0 +1,46 @@
+"""Tests for the URL utilities module."""
+
+import pytest
+
+from shodh._urlutils import extract_links, resolve
+
+
+class TestURLUtils:
+    """Tests for link extraction and URL resolution."""
+
+    @pytest.mark.parametrize(
+        ("current_url", "href", "expected"),
+        [
+            ("https://example.com", "page", "https://example.com/page"),
+            ("https://example.com/a/b", "c", "https://example.com/a/c"),
+            ("https://example.com/a/b?next=/x/y", "c", "https://example.com/a/c"),
+            ("http://example.com/a/b", "/c#top", "http://example.com/c"),
+            ("https://example.com/a/b/", "../c", "https://example.com/a/c"),
+            ("https://example.com/a", "?page=2", "https://example.com/a?page=2"),
+            ("https://example.com/a", "//example.com/c", "https://example.com/c"),
+            ("https://example.com/a", "https://example.com/c", "https://example.com/c"),
+            ("https://example.com/a", "https://example.org/c", None),
+            ("https://example.com/a", "//example.org/c", None),
+            ("https://example.com/a", "https://example.com/c\nd", "https://example.com/cd"),
+            ("https://example.com/a", "https://example.com/c\td", "https://example.com/cd"),
+            ("https://example.com/a", "https://example\n.com/c", "https://example.com/c"),
+            ("https://example.com/a", "p?", "https://example.com/p"),
+            ("https://example.com/a", "/p?#x", "https://example.com/p"),
+            ("https://example.com/a", "https://example.com/p?", "https://example.com/p"),
+        ],
+    )
+    def test_resolve(self, current_url, href, expected):
+        """Relative and absolute hrefs resolve like urljoin."""
+        assert resolve(current_url, href, "example.com") == expected
+
+    def test_extract_links_dedupes_in_order(self):
+        """Links are returned once each, in document order."""
+        html = """
+        <a href="/b">B</a>
+        <a href="/a">A</a>
+        <a href="/b#top">B again</a>
+        <a href="mailto:team@example.com">Mail</a>
+        <a>No href</a>
+        """
+        links = extract_links(html, "https://example.com", "example.com")
+        assert links == ["https://example.com/b", "https://example.com/a"]